@@ -3,12 +3,15 @@
 import streamlit as st
 import os
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from groq import Groq
 from dotenv import load_dotenv
 
 from file_parser import read_uploaded_file
+from section_parser import split_resume_into_sections, merge_parsed_sections
 from pdf_generator import create_beautiful_pdf
-from create_ats_resume import create_ats_generated_resume
+from create_ats_resume import create_ats_generated_resume, create_ats_generated_section
 # --- PAGE CONFIGURATION & API KEY SETUP ---
 st.set_page_config(page_title="AI Professional CV Generator", page_icon="📄", layout="wide")
 
@@ -27,6 +30,17 @@ except Exception:
 
 # --- AI FUNCTIONS ---
 
+# The cv_data schema every parser returns.
+CV_JSON_STRUCTURE = """{
+    "personal_info": { "name": "...", "email": "...", "phone": "...", "linkedin": "..." },
+    "summary": "...",
+    "experience": [ {"title": "...", "company": "...", "dates": "...", "description": "..."} ],
+    "projects": [ {"title": "...", "dates": "...", "description": "..."} ],
+    "achievements": [ {"description": "..."} ],
+    "education": [ {"degree": "Degree Name", "institution_dates": "Institution | Dates"} ],
+    "skills": ["Skill 1", "Skill 2", "Skill 3"]
+    }"""
+
 def parse_resume_with_ai(resume_text, job_description = None):
     """Parses resume text into a structured JSON, now with skills as a list."""
     # (The AI parsing prompt is updated for better skill and education parsing)
@@ -40,15 +54,7 @@ def parse_resume_with_ai(resume_text, job_description = None):
     You are a world-class resume parsing AI. Convert the resume text into a structured JSON object.
     
     **JSON Structure:**
-    {{
-    "personal_info": {{ "name": "...", "email": "...", "phone": "...", "linkedin": "..." }},
-    "summary": "...",
-    "experience": [ {{"title": "...", "company": "...", "dates": "...", "description": "..."}} ],
-    "projects": [ {{"title": "...", "dates": "...", "description": "..."}} ],
-    "achievements": [ {{"description": "..."}} ],
-    "education": [ {{"degree": "Degree Name", "institution_dates": "Institution | Dates"}} ],
-    "skills": ["Skill 1", "Skill 2", "Skill 3"]
-    }}
+    {CV_JSON_STRUCTURE}
 
     **Resume Text to Parse:** --- {resume_text} ---
     """
@@ -64,6 +70,76 @@ def parse_resume_with_ai(resume_text, job_description = None):
         st.error(f"AI parsing failed: {e}")
         return None
 
+# Smaller per-section prompts used by parse_resume_in_sections; each returns a fragment of the cv_data schema.
+SECTION_PROMPTS = {
+    # Text before the first heading, or under headings with no section of their own, can hold anything.
+    "header": "Extract every detail that fits the schema. JSON: " + CV_JSON_STRUCTURE,
+    "other": "Extract every detail that fits the schema. JSON: " + CV_JSON_STRUCTURE,
+    "summary": 'Extract the professional summary. JSON: { "summary": "..." }',
+    "experience": 'Extract every job. JSON: { "experience": [ {"title": "...", "company": "...", "dates": "...", "description": "..."} ] }',
+    "projects": 'Extract every project. JSON: { "projects": [ {"title": "...", "dates": "...", "description": "..."} ] }',
+    "achievements": 'Extract every achievement, award, certification or publication. JSON: { "achievements": [ {"description": "..."} ] }',
+    "education": 'Extract every degree. JSON: { "education": [ {"degree": "Degree Name", "institution_dates": "Institution | Dates"} ] }',
+    "skills": 'Extract every skill as a flat list. JSON: { "skills": ["Skill 1", "Skill 2"] }',
+}
+SECTION_PARSE_ATTEMPTS = 2
+SECTION_RETRY_DELAY = 2  # seconds; parallel requests are the likeliest to hit rate limits
+
+def _parse_section_with_ai(section, section_text, job_description = None):
+    """
+    Tailors one resume section to the job description (if any) and parses it into its cv_data fragment.
+    Runs in a worker thread, so it raises instead of using st.error; a failed request is retried once.
+    """
+    if job_description and section != "header":
+        section_text_ats = create_ats_generated_section(section_text, section, job_description)
+        if section_text_ats != "":
+            section_text = section_text_ats
+
+    prompt = f"""
+    You are a world-class resume parsing AI. The text below is the "{section}" section of a resume.
+    {SECTION_PROMPTS[section]}
+
+    **Section Text to Parse:** --- {section_text} ---
+    """
+    for attempt in range(SECTION_PARSE_ATTEMPTS):
+        try:
+            chat_completion = client.chat.completions.create(
+                messages=[{"role": "system", "content": "You are a resume parsing expert that only outputs valid JSON."}, {"role": "user", "content": prompt}],
+                model="llama3-70b-8192", temperature=0.1, response_format={"type": "json_object"}
+            )
+            return json.loads(chat_completion.choices[0].message.content)
+        except Exception as e:
+            if attempt == SECTION_PARSE_ATTEMPTS - 1:
+                raise
+            print(f"AI parsing of the '{section}' section failed, retrying: {e}")
+            time.sleep(SECTION_RETRY_DELAY)
+
+def parse_resume_in_sections(resume_text, job_description = None):
+    """
+    Faster parse mode for long resumes: splits the extracted text into sections locally, then tailors
+    and parses every section in parallel with section-specific prompts and merges the results into the
+    cv_data schema. Falls back to parse_resume_with_ai when no section headings are found.
+    Returns (cv_data, failed_sections); cv_data is None if nothing could be parsed.
+    """
+    sections = split_resume_into_sections(resume_text)
+    if len(sections) < 2:
+        return parse_resume_with_ai(resume_text, job_description), []
+
+    # One request per section, all at once, so latency follows the largest section.
+    with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+        futures = [executor.submit(_parse_section_with_ai, section, text, job_description) for section, text in sections]
+        fragments, failed_sections = [], []
+        for (section, _), future in zip(sections, futures):
+            try:
+                fragments.append(future.result())
+            except Exception as e:
+                print(f"AI parsing of the '{section}' section failed: {e}")
+                failed_sections.append(section)
+
+    if not fragments:
+        return None, failed_sections
+    return merge_parsed_sections(fragments), failed_sections
+
 def refine_text_with_ai(original_text, context):
     """Generic AI function to refine text, now with achievements context."""
     prompts = {
@@ -120,16 +196,23 @@ with st.expander("📋 Paste Job Description (Optional)"):
 with st.expander("📂 Upload Your Resume to Start (Recommended)"):
     # ... (Upload logic is the same, no changes needed)
     uploaded_file = st.file_uploader("Upload a PDF or Word document.", type=["pdf", "docx"], label_visibility="collapsed")
+    section_mode = st.checkbox("⚡ Parse section by section (faster for long, multi-page CVs)")
     if uploaded_file and st.button("🚀 Analyze Resume with AI"):
         with st.spinner("Reading file..."):
             raw_text = read_uploaded_file(uploaded_file)
         if raw_text:
             with st.spinner("AI is analyzing your resume..."):
-                parsed_data = parse_resume_with_ai(raw_text, job_description)
+                if section_mode:
+                    parsed_data, failed_sections = parse_resume_in_sections(raw_text, job_description)
+                else:
+                    parsed_data, failed_sections = parse_resume_with_ai(raw_text, job_description), []
                 if parsed_data:
                     for key, value in parsed_data.items():
                         if value or (isinstance(value, list) and len(value) > 0):
                             st.session_state.cv_data[key] = value
+                if failed_sections:
+                    st.warning(f"⚠️ AI could not parse these sections: {', '.join(failed_sections)}. Please fill them in manually below.")
+                elif parsed_data:
                     st.success("✅ AI analysis complete! The form is now pre-filled.")
 
 # --- UI: DYNAMIC FORM ---
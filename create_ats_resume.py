@@ -1,6 +1,11 @@
 import os 
+import time
 import requests
 
+def get_mistral_api_key():
+    """Returns the Mistral API key shared by every ATS rewrite, preferring the MISTRAL_API_KEY environment variable."""
+    return os.getenv("MISTRAL_API_KEY") or "oGGtDcv5ECoaWSvDVIlfvDUwF5rx7rKc"
+
 def call_mistral_api(api_key, prompt):
     url = "https://api.mistral.ai/v1/chat/completions"
     headers = {
@@ -36,7 +41,7 @@ def call_mistral_api(api_key, prompt):
 
 def create_ats_generated_resume(my_resume,job_description):
     # Get your Groq API key from the environment variable 
-    api_key = "oGGtDcv5ECoaWSvDVIlfvDUwF5rx7rKc"
+    api_key = get_mistral_api_key()
 
 
     # --- THE PROMPT FOR THE GROQ MODEL --- 
@@ -55,4 +60,25 @@ def create_ats_generated_resume(my_resume,job_description):
 
     except Exception as e: 
         print(f"An error occurred: {e}") 
+        return ""
+
+
+def create_ats_generated_section(section_text, section_name, job_description):
+    """Rewrites a single resume section for the job description, so long resumes can be tailored section by section."""
+    api_key = get_mistral_api_key()
+
+    prompt = f"""
+            Below is the {section_name} section of my resume:\n\n{section_text}\n\n
+            Job Description:\n\n{job_description}\n\n
+            Please rewrite only this section according to this Job Description, keeping every fact, date and entry from it. Write exact terms used in the JD. If this is the skills section, also add my skills according to JD. Output only the rewritten section text.
+            """
+
+    try:
+        response = call_mistral_api(api_key, prompt)
+        content = response["choices"][0]["message"]["content"]
+
+        return content
+
+    except Exception as e:
+        print(f"An error occurred: {e}")
         return ""
\ No newline at end of file
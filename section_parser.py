@@ -0,0 +1,155 @@
+# section_parser.py
+
+import re
+
+# Canonical cv_data section for each heading a resume commonly uses.
+SECTION_HEADINGS = {
+    "summary": "summary", "professional summary": "summary", "profile": "summary",
+    "objective": "summary", "career objective": "summary", "about me": "summary",
+    "experience": "experience", "work experience": "experience",
+    "professional experience": "experience", "employment": "experience",
+    "employment history": "experience", "research experience": "experience",
+    "teaching experience": "experience", "work history": "experience",
+    "internships": "experience", "internship": "experience",
+    "projects": "projects", "personal projects": "projects",
+    "academic projects": "projects", "research projects": "projects",
+    "achievements": "achievements", "awards": "achievements", "honors": "achievements",
+    "honours": "achievements", "certifications": "achievements", "publications": "achievements",
+    "accomplishments": "achievements", "grants": "achievements",
+    "education": "education", "academic background": "education",
+    "qualifications": "education", "academic qualifications": "education",
+    "skills": "skills", "technical skills": "skills", "core competencies": "skills",
+    "key skills": "skills", "technologies": "skills", "languages": "skills",
+}
+# Common headings with no cv_data section of their own; their text goes to the "other" chunk.
+OTHER_HEADINGS = {
+    "volunteer experience", "volunteering", "references", "research interests", "interests",
+    "teaching", "talks", "invited talks", "presentations", "conferences", "service",
+    "professional service", "memberships", "professional memberships", "affiliations",
+    "activities", "extracurricular activities", "leadership", "hobbies", "patents",
+    "courses", "coursework", "relevant coursework", "training", "workshops",
+    "personal details", "personal information", "contact", "declaration",
+}
+# Chunks parsed with the full cv_data schema, because their content can belong anywhere.
+FULL_SCHEMA_SECTIONS = ("header", "other")
+# Longest headings first, so "research projects" wins over a shorter prefix.
+_HEADINGS_BY_LENGTH = sorted(SECTION_HEADINGS, key=len, reverse=True)
+# Markdown markers, bullets and rules that LLM-written or decorated resumes put around headings.
+_HEADING_DECORATION = " \t#*_-=>|~•·▪●■◆–—"
+# Words that may follow a known heading in a near-variant such as "Skills & Tools" or "Education Details".
+_HEADING_QUALIFIERS = {"and", "summary", "details", "highlights", "overview", "history", "section"}
+MAX_HEADING_WORDS = 5
+
+def _match_section_heading(line):
+    """
+    Returns (section, inline_text) if the line is a section heading, otherwise None.
+    Decorations such as "## Experience" or "**Education**" are ignored. A labelled line like
+    "Skills: Python, SQL" returns its value as inline_text; unrecognised standalone headings
+    ("Volunteer Experience", "## Talks") return the "other" section.
+    """
+    candidate = line.strip().strip(_HEADING_DECORATION)
+    heading, _, inline_text = candidate.partition(":")
+    heading = heading.strip(_HEADING_DECORATION + ".")
+    inline_text = inline_text.strip()
+    words = heading.replace("&", " and ").replace("/", " and ").split()
+    if not words or len(words) > MAX_HEADING_WORDS:
+        return None
+    normalized = " ".join(words).lower()
+    if normalized in SECTION_HEADINGS:
+        return SECTION_HEADINGS[normalized], inline_text
+    # Near-variants must start with a known heading followed by a connector or qualifier, so lines
+    # like "Experience with cloud platforms" or "Education Technology Lead" are not split on.
+    for known in _HEADINGS_BY_LENGTH:
+        if normalized.startswith(known + " "):
+            next_word = normalized[len(known) + 1:].split()[0]
+            if next_word in _HEADING_QUALIFIERS or not next_word[0].isalpha():
+                return SECTION_HEADINGS[known], inline_text
+            return None
+    if not inline_text and (normalized in OTHER_HEADINGS or line.lstrip().startswith("#")):
+        return "other", ""
+    return None
+
+def split_resume_into_sections(resume_text):
+    """
+    Splits extracted resume text into (section, text) chunks using standalone heading lines.
+    Text before the first heading is returned as the "header" chunk (name, contact details).
+    Headings that map to the same section are combined into one chunk, in document order.
+    A labelled line such as "Technologies: Python" stays in the current chunk and its value is
+    also copied to the labelled section, since the current section's prompt may not extract it.
+    """
+    sections = {}
+    current_section = "header"
+    for line in resume_text.splitlines():
+        match = _match_section_heading(line)
+        if match and not match[1]:
+            current_section = match[0]
+            # Blank line keeps chunks from repeated headings apart once they are combined.
+            sections.setdefault(current_section, []).append("")
+            continue
+        sections.setdefault(current_section, []).append(line)
+        if match and current_section not in FULL_SCHEMA_SECTIONS and match[0] not in (current_section, "other"):
+            sections.setdefault(match[0], []).append(match[1])
+    chunks = []
+    for section, lines in sections.items():
+        text = "\n".join(lines).strip()
+        if text:
+            chunks.append((section, text))
+    return chunks
+
+def _dedupe_key(value):
+    """Normalizes an entry (string or dict) so repeated entries compare equal regardless of case and spacing."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _dedupe_key(v)) for k, v in value.items() if v))
+    return " ".join(str(value).lower().split())
+
+# Field that holds a bare string returned where a list of entries was expected.
+_TEXT_FIELDS = {"experience": "description", "projects": "description", "achievements": "description", "education": "degree"}
+
+def _coerce_entries(key, value):
+    """Turns a list field returned in the wrong shape (a string, or a single dict) into a list of entries."""
+    if isinstance(value, (str, dict)):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    entries = []
+    for entry in value:
+        if key == "skills" and isinstance(entry, str):
+            entries.extend(skill.strip() for skill in re.split(r"[,;\n]", entry))
+        elif key != "skills" and isinstance(entry, dict):
+            entries.append(entry)
+        elif key != "skills" and isinstance(entry, str):
+            entries.append({_TEXT_FIELDS[key]: entry.strip()})
+    return entries
+
+def merge_parsed_sections(fragments):
+    """
+    Merges per-section fragments into the cv_data schema.
+    Fragments are merged in document order: the first non-empty scalar wins and list entries
+    are de-duplicated by their normalized content, so the result does not depend on which
+    request finished first.
+    """
+    cv_data = {
+        "personal_info": {}, "summary": "", "experience": [], "projects": [],
+        "achievements": [], "education": [], "skills": []
+    }
+    seen = {key: set() for key, value in cv_data.items() if isinstance(value, list)}
+    for fragment in fragments:
+        if not isinstance(fragment, dict):
+            continue
+        for key, value in fragment.items():
+            if key not in cv_data or not value:
+                continue
+            if key == "personal_info" and isinstance(value, dict):
+                for field, field_value in value.items():
+                    if field_value and not cv_data["personal_info"].get(field):
+                        cv_data["personal_info"][field] = field_value
+            elif key == "summary":
+                if isinstance(value, str) and value.strip() and not cv_data["summary"]:
+                    cv_data["summary"] = value
+            elif key != "personal_info":
+                for entry in _coerce_entries(key, value):
+                    entry_key = _dedupe_key(entry)
+                    if entry and entry_key not in seen[key]:
+                        seen[key].add(entry_key)
+                        cv_data[key].append(entry)
+    return cv_data
@@ -0,0 +1,113 @@
+# tests/test_section_parser.py
+
+from section_parser import split_resume_into_sections, merge_parsed_sections
+
+
+def test_plain_headings_split_in_document_order():
+    text = "Jane Doe\njane@example.com\n\nSUMMARY\nEngineer.\nWork Experience:\nDev at X\nEducation\nBSc"
+    assert split_resume_into_sections(text) == [
+        ("header", "Jane Doe\njane@example.com"),
+        ("summary", "Engineer."),
+        ("experience", "Dev at X"),
+        ("education", "BSc"),
+    ]
+
+def test_markdown_and_decorated_headings_are_recognised():
+    text = "John\n## Experience\nDev\n**Education**\nBSc\n• Projects •\nCV tool\n--- Skills ---\nPython"
+    assert split_resume_into_sections(text) == [
+        ("header", "John"),
+        ("experience", "Dev"),
+        ("education", "BSc"),
+        ("projects", "CV tool"),
+        ("skills", "Python"),
+    ]
+
+def test_heading_variants_match_on_leading_keyword():
+    text = "John\nEducation\nBSc\nSkills & Tools\nPython\nHonors and Awards\nBest paper"
+    assert split_resume_into_sections(text) == [
+        ("header", "John"),
+        ("education", "BSc"),
+        ("skills", "Python"),
+        ("achievements", "Best paper"),
+    ]
+
+def test_labelled_line_in_header_stays_in_header():
+    text = "Jane Doe\nProfile: linkedin.com/in/jane\njane@x.com\n555-1234"
+    assert split_resume_into_sections(text) == [("header", text)]
+
+def test_labelled_line_is_copied_without_switching_section():
+    text = "Projects\nCV Tool\nTechnologies: Python, React\nBuilt a resume tool used by 1k users"
+    assert split_resume_into_sections(text) == [
+        ("projects", "CV Tool\nTechnologies: Python, React\nBuilt a resume tool used by 1k users"),
+        ("skills", "Python, React"),
+    ]
+    assert split_resume_into_sections("Experience\nAcme Corp\nSkills: Python\nLed team of 5") == [
+        ("experience", "Acme Corp\nSkills: Python\nLed team of 5"),
+        ("skills", "Python"),
+    ]
+
+def test_unrecognised_headings_go_to_other_chunk():
+    assert split_resume_into_sections("Summary\nGood\nVolunteer Experience\nRed Cross") == [
+        ("summary", "Good"), ("other", "Red Cross")
+    ]
+    assert split_resume_into_sections("Skills\nPy\nReferences\nAvailable on request\n## Talks\nPyCon") == [
+        ("skills", "Py"), ("other", "Available on request\n\nPyCon")
+    ]
+
+def test_body_lines_starting_with_a_heading_word_are_not_split_on():
+    text = "John\nExperience\nEducation Technology Lead\n- Experience with cloud platforms"
+    assert split_resume_into_sections(text) == [
+        ("header", "John"),
+        ("experience", "Education Technology Lead\n- Experience with cloud platforms"),
+    ]
+
+def test_repeated_sections_are_combined_into_one_chunk():
+    text = "John\nResearch Experience\nPostdoc\nPublications\nPaper\nTeaching Experience\nTA\nGrants\nGrant"
+    assert split_resume_into_sections(text) == [
+        ("header", "John"),
+        ("experience", "Postdoc\n\nTA"),
+        ("achievements", "Paper\n\nGrant"),
+    ]
+
+def test_text_without_headings_is_a_single_header_chunk():
+    assert split_resume_into_sections("John\nDev at X") == [("header", "John\nDev at X")]
+
+def test_merge_fills_the_cv_data_schema():
+    cv_data = merge_parsed_sections([{"skills": ["Python"]}])
+    assert cv_data == {
+        "personal_info": {}, "summary": "", "experience": [], "projects": [],
+        "achievements": [], "education": [], "skills": ["Python"]
+    }
+
+def test_merge_first_non_empty_scalar_wins():
+    cv_data = merge_parsed_sections([
+        {"personal_info": {"name": "Jane Doe", "email": ""}, "summary": ""},
+        {"personal_info": {"name": "J. Doe", "email": "jane@example.com"}, "summary": "First."},
+        {"summary": "Second."},
+    ])
+    assert cv_data["personal_info"] == {"name": "Jane Doe", "email": "jane@example.com"}
+    assert cv_data["summary"] == "First."
+
+def test_merge_dedupes_normalized_entries_in_document_order():
+    cv_data = merge_parsed_sections([
+        {"skills": ["Python", "python ", "SQL"]},
+        {"skills": ["Go", "  PYTHON"], "experience": [{"title": "Engineer", "company": "X"}]},
+        {"experience": [{"company": "x", "title": "engineer ", "dates": ""}, {"title": "Lead", "company": "X"}]},
+    ])
+    assert cv_data["skills"] == ["Python", "SQL", "Go"]
+    assert cv_data["experience"] == [{"title": "Engineer", "company": "X"}, {"title": "Lead", "company": "X"}]
+
+def test_merge_coerces_wrongly_shaped_values():
+    cv_data = merge_parsed_sections([
+        {"summary": ["Not a string"], "skills": "Python, SQL; Go", "experience": {"title": "Engineer"}},
+        {"summary": "Real summary.", "achievements": "Best paper", "skills": ["python"]},
+    ])
+    assert cv_data["summary"] == "Real summary."
+    assert cv_data["skills"] == ["Python", "SQL", "Go"]
+    assert cv_data["experience"] == [{"title": "Engineer"}]
+    assert cv_data["achievements"] == [{"description": "Best paper"}]
+
+def test_merge_ignores_unknown_keys_and_malformed_fragments():
+    cv_data = merge_parsed_sections([None, ["Python"], {"hobbies": ["Chess"], "skills": ["Python"]}])
+    assert "hobbies" not in cv_data
+    assert cv_data["skills"] == ["Python"]